@@ -1,26 +1,362 @@
+import random
+import threading
+import time
+import tracemalloc
+from array import array
+from collections import Counter, deque
+from itertools import chain
+from timeit import timeit
+
+
 class CollectionManager:
     def __init__(self):
         self._collection = []  # Assign an empty list as the initial value
+        self._version = 0  # Bumped by every change to the collection
+        self._snapshot = ()  # Cached read-only view, valid for _snapshot_version
+        self._snapshot_version = 0
+
+    # Version counter, lets readers cheaply detect that the collection has changed
+    @property
+    def version(self):
+        return self._version
 
-    # Getter for the collection (read-only)
+    # Getter for the collection (read-only).
+    # The tuple is only rebuilt after a change, so repeated reads return the same object.
     @property
     def collection(self):
-        return tuple(self._collection)  # Return a read-only representation
+        if self._snapshot_version != self._version:
+            self._snapshot = self._build_snapshot()
+            self._snapshot_version = self._version
+        return self._snapshot
+
+    # Build a fresh read-only representation of the current contents
+    def _build_snapshot(self):
+        return tuple(self._collection)
+
+    # Mark the collection as changed, invalidating the cached snapshot
+    def _changed(self):
+        self._version += 1
 
     # Method for adding elements to the collection
     def add_element(self, element):
         self._collection.append(element)
+        self._changed()
 
     # Method for deleting elements from the collection
     def delete_element(self, element):
         if element in self._collection:
             self._collection.remove(element)
+            self._changed()
         else:
             print("Element not found in the collection.")
 
+    # Method for adding several elements with a single call
+    def add_many(self, *elements):
+        self.extend_from_iterable(elements)
+
+    # Bulk add: the collection grows in one step and the version is bumped once
+    def extend_from_iterable(self, iterable):
+        self._collection.extend(iterable)
+        self._changed()
+
+    # Bulk delete: removes the first occurrence of each element in a single pass
+    # over the collection. Falls back to one list.remove per element when the
+    # collection holds unhashable elements.
+    def delete_many(self, elements):
+        elements = list(elements)
+        try:
+            pending = Counter(elements)
+            kept = []
+            for element in self._collection:
+                if pending[element] > 0:
+                    pending[element] -= 1
+                else:
+                    kept.append(element)
+            missing = list(pending.elements())
+        except TypeError:
+            kept = list(self._collection)
+            missing = []
+            for element in elements:
+                try:
+                    kept.remove(element)
+                except ValueError:
+                    missing.append(element)
+        removed = len(self._collection) - len(kept)
+        self._collection = kept
+        self._report_missing(missing)
+        if removed:
+            self._changed()
+
+    # Report elements passed to delete_many that were not found
+    @staticmethod
+    def _report_missing(missing):
+        for element in missing:
+            print(f"Element not found in the collection: {element!r}")
+
     # Setter (renamed to replace) for the collection
     def replace_collection(self, new_collection):
         self._collection = list(new_collection)
+        self._changed()
+
+
+# Indexed variant: same interface, but membership tests and deletes are O(1) on average.
+# Elements must be hashable. Insertion order (including duplicates) is preserved.
+class IndexedCollectionManager(CollectionManager):
+    def __init__(self):
+        super().__init__()
+        self._collection = {}  # Insertion-ordered slots: slot id -> element
+        self._index = {}  # element -> deque of slot ids, oldest first
+        self._next_slot = 0
+
+    def _build_snapshot(self):
+        return tuple(self._collection.values())
+
+    # Membership test backed by the index instead of a linear scan
+    def __contains__(self, element):
+        return element in self._index
+
+    def __len__(self):
+        return len(self._collection)
+
+    # Store one element in a new slot and record it in the index.
+    # Unique elements map to a bare slot id; only duplicates pay for a deque.
+    def _insert(self, element):
+        slot = self._next_slot
+        self._next_slot += 1
+        self._collection[slot] = element
+        slots = self._index.get(element)
+        if slots is None:
+            self._index[element] = slot
+        elif type(slots) is int:
+            self._index[element] = deque((slots, slot))
+        else:
+            slots.append(slot)
+
+    # Drop the oldest slot holding the element, returns False if it is absent
+    def _remove_first(self, element):
+        slots = self._index.get(element)
+        if slots is None:
+            return False
+        if type(slots) is int:
+            del self._collection[slots]
+            del self._index[element]
+        else:
+            del self._collection[slots.popleft()]
+            if len(slots) == 1:
+                self._index[element] = slots[0]
+        return True
+
+    # Method for adding elements to the collection
+    def add_element(self, element):
+        self._insert(element)
+        self._changed()
+
+    # Method for deleting elements from the collection (first occurrence, like list.remove)
+    def delete_element(self, element):
+        if self._remove_first(element):
+            self._changed()
+        else:
+            print("Element not found in the collection.")
+
+    # Bulk add: the index is maintained in the same pass that stores the elements
+    def extend_from_iterable(self, iterable):
+        insert = self._insert
+        for element in iterable:
+            insert(element)
+        self._changed()
+
+    # Bulk delete: one index lookup per element, no scan of the collection
+    def delete_many(self, elements):
+        remove_first = self._remove_first
+        missing = []
+        removed = 0
+        for element in elements:
+            if remove_first(element):
+                removed += 1
+            else:
+                missing.append(element)
+        self._report_missing(missing)
+        if removed:
+            self._changed()
+
+    # Setter (renamed to replace) for the collection
+    def replace_collection(self, new_collection):
+        self._collection = {}
+        self._index = {}
+        self._next_slot = 0
+        self.extend_from_iterable(new_collection)
+
+
+# Typed variant for numeric elements: stores them packed in an array.array
+# instead of a list of boxed Python objects. `typecode` follows the array module
+# ("q" for 64-bit ints, "d" for doubles, ...).
+class TypedCollectionManager(CollectionManager):
+    def __init__(self, typecode="q"):
+        super().__init__()
+        self._collection = array(typecode)
+
+    @property
+    def typecode(self):
+        return self._collection.typecode
+
+    # Method for deleting elements from the collection (a single scan, unlike `in` + remove)
+    def delete_element(self, element):
+        try:
+            self._collection.remove(element)
+        except ValueError:
+            print("Element not found in the collection.")
+        else:
+            self._changed()
+
+    # Bulk delete: rebuilds the packed buffer in a single pass
+    def delete_many(self, elements):
+        pending = Counter(elements)
+        kept = array(self.typecode)
+        for element in self._collection:
+            if pending[element] > 0:
+                pending[element] -= 1
+            else:
+                kept.append(element)
+        removed = len(self._collection) - len(kept)
+        self._collection = kept
+        self._report_missing(pending.elements())
+        if removed:
+            self._changed()
+
+    # Setter (renamed to replace) for the collection
+    def replace_collection(self, new_collection):
+        self._collection = array(self.typecode, new_collection)
+        self._changed()
+
+
+# Immutable version of a ConcurrentCollectionManager's contents.
+# Elements are stored in fixed-size chunks so a new version can share every
+# chunk it did not touch with the previous one (copy-on-write).
+class CollectionSnapshot:
+    __slots__ = ("version", "_chunks", "_length", "_flat")
+
+    def __init__(self, version, chunks, length):
+        self.version = version
+        self._chunks = chunks  # tuple of tuples, none of them empty
+        self._length = length
+        self._flat = None
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def __contains__(self, element):
+        return any(element in chunk for chunk in self._chunks)
+
+    # Flat read-only representation, built at most once per version
+    def as_tuple(self):
+        if self._flat is None:
+            self._flat = tuple(self)
+        return self._flat
+
+
+# Multi-version variant for many reader threads and a few writer threads.
+# Readers never lock: they grab the current CollectionSnapshot with a single
+# attribute read and keep a stable view for as long as they hold it.
+# Writers serialize on a lock, build the next version from the shared chunks
+# and publish it with a single attribute assignment.
+class ConcurrentCollectionManager(CollectionManager):
+    CHUNK_SIZE = 256
+
+    def __init__(self):
+        super().__init__()
+        self._collection = None  # The contents live in the published snapshots
+        self._write_lock = threading.Lock()
+        self._head = CollectionSnapshot(0, (), 0)
+
+    @property
+    def version(self):
+        return self._head.version
+
+    # Getter for the collection (read-only), lock-free
+    @property
+    def collection(self):
+        return self._head.as_tuple()
+
+    def _build_snapshot(self):
+        return self._head.as_tuple()
+
+    # Stable view of the current version, lock-free
+    def snapshot(self):
+        return self._head
+
+    def __len__(self):
+        return len(self._head)
+
+    # Publish the next version; must be called with the write lock held
+    def _publish(self, chunks, length):
+        self._head = CollectionSnapshot(self._head.version + 1, chunks, length)
+
+    # Append elements to a chunk tuple, copying only the last (partial) chunk
+    def _appended(self, chunks, elements):
+        size = self.CHUNK_SIZE
+        if chunks and len(chunks[-1]) < size:
+            elements = chunks[-1] + elements
+            chunks = chunks[:-1]
+        return chunks + tuple(elements[i:i + size] for i in range(0, len(elements), size))
+
+    # Chunk tuple without the first occurrence of element, or None if it is absent
+    @staticmethod
+    def _removed(chunks, element):
+        for position, chunk in enumerate(chunks):
+            if element in chunk:
+                offset = chunk.index(element)
+                rest = chunk[:offset] + chunk[offset + 1:]
+                middle = (rest,) if rest else ()
+                return chunks[:position] + middle + chunks[position + 1:]
+        return None
+
+    # Method for adding elements to the collection
+    def add_element(self, element):
+        with self._write_lock:
+            head = self._head
+            self._publish(self._appended(head._chunks, (element,)), head._length + 1)
+
+    # Bulk add: published as a single new version
+    def extend_from_iterable(self, iterable):
+        elements = tuple(iterable)
+        with self._write_lock:
+            head = self._head
+            self._publish(self._appended(head._chunks, elements), head._length + len(elements))
+
+    # Method for deleting elements from the collection
+    def delete_element(self, element):
+        with self._write_lock:
+            head = self._head
+            chunks = self._removed(head._chunks, element)
+            if chunks is not None:
+                self._publish(chunks, head._length - 1)
+                return
+        print("Element not found in the collection.")
+
+    # Bulk delete: published as a single new version
+    def delete_many(self, elements):
+        missing = []
+        with self._write_lock:
+            head = self._head
+            chunks, length = head._chunks, head._length
+            for element in elements:
+                remaining = self._removed(chunks, element)
+                if remaining is None:
+                    missing.append(element)
+                else:
+                    chunks, length = remaining, length - 1
+            if length != head._length:
+                self._publish(chunks, length)
+        self._report_missing(missing)
+
+    # Setter (renamed to replace) for the collection
+    def replace_collection(self, new_collection):
+        elements = tuple(new_collection)
+        with self._write_lock:
+            self._publish(self._appended((), elements), len(elements))
 
 # Client code
 manager = CollectionManager()
@@ -39,6 +375,125 @@ print(manager.collection)  # Output: (1, 3)
 manager.replace_collection([4, 5, 6])
 print(manager.collection)  # Output: (4, 5, 6)
 
+# Reads between changes return the same cached snapshot
+print(manager.collection is manager.collection)  # Output: True
+print(manager.version)  # Output: 5
+
+# The indexed manager is a drop-in replacement
+indexed_manager = IndexedCollectionManager()
+indexed_manager.replace_collection([1, 2, 3, 2])
+indexed_manager.delete_element(2)
+print(indexed_manager.collection)  # Output: (1, 3, 2)
+
+# Bulk operations and the packed numeric backend
+typed_manager = TypedCollectionManager("q")
+typed_manager.add_many(1, 2, 3)
+typed_manager.extend_from_iterable(range(4, 7))
+typed_manager.delete_many([2, 4])
+print(typed_manager.collection)  # Output: (1, 3, 5, 6)
+
+# Readers of the multi-version manager keep a stable snapshot while writers move on
+concurrent_manager = ConcurrentCollectionManager()
+concurrent_manager.add_many(1, 2, 3)
+snapshot = concurrent_manager.snapshot()
+concurrent_manager.delete_element(2)
+print(tuple(snapshot), concurrent_manager.collection)  # Output: (1, 2, 3) (1, 3)
+
+
+# Benchmark: delete every element (in random order) from a manager holding `size` elements
+def benchmark_delete(size=10_000):
+    elements = list(range(size))
+    victims = elements[:]
+    random.shuffle(victims)
+    for manager_class in (CollectionManager, IndexedCollectionManager):
+        manager = manager_class()
+        manager.replace_collection(elements)
+        seconds = timeit(lambda: [manager.delete_element(v) for v in victims], number=1)
+        print(f"{manager_class.__name__}: {size} deletes in {seconds:.4f}s")
+
+
+# Benchmark: repeated reads of the collection property with no writes in between
+def benchmark_read(size=100_000, reads=1_000):
+    manager = CollectionManager()
+    manager.replace_collection(range(size))
+    seconds = timeit(lambda: manager.collection, number=reads)
+    print(f"{reads} cached reads of {size} elements in {seconds:.4f}s")
+
+
+# Benchmark: bulk-ingest throughput and resident memory for each storage backend
+def benchmark_backends(size=1_000_000):
+    backends = {
+        "list": CollectionManager,
+        "indexed": IndexedCollectionManager,
+        "typed": TypedCollectionManager,
+    }
+    for name, manager_class in backends.items():
+        tracemalloc.start()
+        manager = manager_class()
+        seconds = timeit(lambda: manager.extend_from_iterable(range(size)), number=1)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name}: {size} elements ingested in {seconds:.4f}s, {memory / 2**20:.1f} MiB")
+
+
+# Baseline for benchmark_contention: every read and write takes one coarse lock
+class _CoarseLockedCollectionManager(CollectionManager):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._collection)
+
+    def add_element(self, element):
+        with self._lock:
+            super().add_element(element)
+
+    def delete_element(self, element):
+        with self._lock:
+            super().delete_element(element)
+
+
+# Benchmark: read throughput of `readers` threads while 0..max_writers threads churn the collection.
+# Both readers do the same O(1) work (len), so the numbers compare the locking strategies.
+def benchmark_contention(size=10_000, readers=4, max_writers=4, duration=0.5):
+    for manager_class in (_CoarseLockedCollectionManager, ConcurrentCollectionManager):
+        for writers in range(max_writers + 1):
+            manager = manager_class()
+            manager.replace_collection(range(size))
+            stop = threading.Event()
+            reads = [0] * readers
+
+            def read(slot):
+                while not stop.is_set():
+                    len(manager)
+                    reads[slot] += 1
+
+            def write(seed):
+                element = size + seed
+                while not stop.is_set():
+                    manager.add_element(element)
+                    manager.delete_element(element)
+
+            threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+            threads += [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+            for thread in threads:
+                thread.start()
+            time.sleep(duration)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            print(f"{manager_class.__name__.lstrip('_')}: {writers} writers, "
+                  f"{sum(reads) / duration:,.0f} reads/s")
+
+
+if __name__ == "__main__":
+    benchmark_delete()
+    benchmark_read()
+    benchmark_backends()
+    benchmark_contention()
+
 # Methods for adding and deleting collection elements (add_element and delete_element) are created. They accept collection elements as parameters.
 # An empty list is assigned to the _collection field in the class constructor (__init__) if not done so already.
 # The setter for the collection field is renamed to replace_collection, as it's used to replace all collection elements with other ones.
@@ -5,8 +5,25 @@
 # Create subclasses matching the branches of the conditional. 
 # In them, create a shared method and move code from the corresponding branch of the conditional to it. 
 # Then replace the conditional with the relevant method call. The result is that the proper implementation will be attained via polymorphism depending on the object class.
+from array import array
+from operator import mul, not_, sub
+
+
 class Bird:
-    # ...
+    def __init__(self, baseSpeed, loadFactor=0.0, numberOfCoconuts=0, voltage=0.0, isNailed=False):
+        self.baseSpeed = baseSpeed
+        self.loadFactor = loadFactor
+        self.numberOfCoconuts = numberOfCoconuts
+        self.voltage = voltage
+        self.isNailed = isNailed
+
+    def getBaseSpeed(self, voltage=None):
+        # Placeholder formula: voltage scales the base speed
+        return self.baseSpeed if voltage is None else self.baseSpeed * voltage
+
+    def getLoadFactor(self):
+        return self.loadFactor
+
     def getSpeed(self):
         pass
 
@@ -24,5 +41,57 @@ class NorwegianBlue(Bird):
     def getSpeed(self):
         return 0 if self.isNailed else self.getBaseSpeed(self.voltage)
 
+
+# Columnar batch for computing the speed of many birds at once.
+# Each subtype keeps only the fields its formula needs, in packed arrays, and
+# getSpeeds() applies the per-type formula to whole columns instead of making
+# one polymorphic getSpeed() call per bird.
+class BirdBatch:
+    COLUMNS = {
+        European: {"baseSpeed": "d"},
+        African: {"baseSpeed": "d", "loadFactor": "d", "numberOfCoconuts": "q"},
+        NorwegianBlue: {"baseSpeed": "d", "voltage": "d", "isNailed": "b"},
+    }
+
+    def __init__(self):
+        self.columns = {
+            birdType: {name: array(typecode) for name, typecode in layout.items()}
+            for birdType, layout in self.COLUMNS.items()
+        }
+
+    @classmethod
+    def fromBirds(cls, birds):
+        batch = cls()
+        for bird in birds:
+            batch.add(bird)
+        return batch
+
+    def add(self, bird):
+        for name, column in self.columns[type(bird)].items():
+            column.append(getattr(bird, name))
+
+    def __len__(self):
+        return sum(len(columns["baseSpeed"]) for columns in self.columns.values())
+
+    # Speeds per subtype, in the order the birds were added
+    def getSpeeds(self):
+        european = self.columns[European]
+        african = self.columns[African]
+        norwegianBlue = self.columns[NorwegianBlue]
+        return {
+            European: array("d", european["baseSpeed"]),
+            African: array("d", map(sub, african["baseSpeed"],
+                                    map(mul, african["loadFactor"], african["numberOfCoconuts"]))),
+            NorwegianBlue: array("d", map(mul, map(mul, norwegianBlue["baseSpeed"], norwegianBlue["voltage"]),
+                                          map(not_, norwegianBlue["isNailed"]))),
+        }
+
+
 # Somewhere in client code
-speed = Bird.getSpeed()
+birds = [European(10.0), African(10.0, 0.5, 3), NorwegianBlue(2.0, voltage=3.0), NorwegianBlue(2.0, isNailed=True)]
+speeds = [bird.getSpeed() for bird in birds]
+print(speeds)  # Output: [10.0, 8.5, 6.0, 0]
+
+batchSpeeds = BirdBatch.fromBirds(birds).getSpeeds()
+print([list(batchSpeeds[birdType]) for birdType in (European, African, NorwegianBlue)])
+# Output: [[10.0], [8.5], [6.0, 0.0]]
@@ -4,14 +4,31 @@
 # Solution
 # Replace the methods with fields in the parent class and delete the subclasses.
 
+import heapq
+import sys
+import weakref
+from array import array
+from collections import OrderedDict
+from itertools import compress, repeat
+from operator import mul
+
+
 class Shape:
+    # No per-instance __dict__: the field-based Shape is already the compact form.
+    # Subclasses that add fields still get a __dict__.
+    __slots__ = ("name", "_constant_area")
+
     def __init__(self, name, constant_area):
         self.name = name
         self._constant_area = constant_area
 
     @classmethod
-    def create_shape(cls, name, constant_area):
-        return cls(name, constant_area)
+    def create_shape(cls, name, constant_area, shared=False):
+        # The subclasses pass an already computed area, so build the field-based
+        # Shape here rather than cls (whose constructor expects dimensions).
+        if shared:
+            return cls.flyweights.get(name, constant_area)
+        return Shape(name, constant_area)
 
     def area(self):
         return self._constant_area
@@ -22,8 +39,8 @@ class Circle(Shape):
         self.radius = radius
 
     @classmethod
-    def create_shape(cls, name, radius):
-        return super().create_shape(name, 3.14 * radius ** 2)
+    def create_shape(cls, name, radius, shared=False):
+        return super().create_shape(name, 3.14 * radius ** 2, shared)
 
 class Rectangle(Shape):
     def __init__(self, name, width, height):
@@ -32,5 +49,139 @@ class Rectangle(Shape):
         self.height = height
 
     @classmethod
-    def create_shape(cls, name, width, height):
-        return super().create_shape(name, width * height)
+    def create_shape(cls, name, width, height, shared=False):
+        return super().create_shape(name, width * height, shared)
+
+
+class SharedShape(Shape):
+    """
+    Immutable shape handed out by the flyweight cache. Every caller asking for
+    the same (name, area) gets this one instance, so it must not be modified.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def __init__(self, name, constant_area):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "_constant_area", constant_area)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("shared shapes are immutable")
+
+    def __delattr__(self, attr):
+        raise AttributeError("shared shapes are immutable")
+
+
+class ShapeFlyweights:
+    """
+    Interning cache behind create_shape(..., shared=True). With `maxsize` it
+    keeps the most recently used shapes (LRU); with `weak=True` a shape is
+    evicted as soon as no caller holds it any more.
+    """
+
+    def __init__(self, maxsize=4096, weak=False):
+        self.maxsize = maxsize
+        self.weak = weak
+        self.clear()
+
+    def clear(self):
+        self._shapes = weakref.WeakValueDictionary() if self.weak else OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def get(self, name, constant_area):
+        key = (name, constant_area)
+        shape = self._shapes.get(key)
+        if shape is not None:
+            self.hits += 1
+            if not self.weak:
+                self._shapes.move_to_end(key)
+            return shape
+        self.misses += 1
+        shape = SharedShape(sys.intern(name), constant_area)
+        self._shapes[key] = shape
+        if not self.weak and self.maxsize is not None and len(self._shapes) > self.maxsize:
+            self._shapes.popitem(last=False)
+            self.evictions += 1
+        return shape
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self)}
+
+
+Shape.flyweights = ShapeFlyweights()
+
+
+class ShapeTable:
+    """
+    Columnar storage for many shapes: names, kinds and dimensions live in
+    contiguous arrays, areas are computed a whole batch at a time and queries
+    run over the area column instead of calling area() on every object.
+    """
+
+    SHAPE, CIRCLE, RECTANGLE = range(3)
+
+    def __init__(self):
+        self.names = []
+        self.kinds = array("B")
+        self.dim_1 = array("d")  # area for SHAPE, radius for CIRCLE, width for RECTANGLE
+        self.dim_2 = array("d")  # height for RECTANGLE, 0.0 otherwise
+        self.areas = array("d")
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def _add_rows(self, kind, names, dim_1, dim_2, areas):
+        names = [sys.intern(name) for name in names]
+        self.names.extend(names)
+        self.kinds.extend(repeat(kind, len(names)))
+        self.dim_1.extend(dim_1)
+        self.dim_2.extend(dim_2)
+        self.areas.extend(areas)
+
+    def add_shapes(self, names, constant_areas):
+        constant_areas = array("d", constant_areas)
+        self._add_rows(self.SHAPE, names, constant_areas, repeat(0.0, len(constant_areas)), constant_areas)
+
+    def add_circles(self, names, radii):
+        radii = array("d", radii)
+        areas = map(mul, repeat(3.14), map(mul, radii, radii))
+        self._add_rows(self.CIRCLE, names, radii, repeat(0.0, len(radii)), areas)
+
+    def add_rectangles(self, names, widths, heights):
+        widths, heights = array("d", widths), array("d", heights)
+        self._add_rows(self.RECTANGLE, names, widths, heights, map(mul, widths, heights))
+
+    def total_area(self):
+        return sum(self.areas)
+
+    # Names of the shapes whose area lies in [min_area, max_area]
+    def filter_by_area(self, min_area=float("-inf"), max_area=float("inf")):
+        selected = (min_area <= area <= max_area for area in self.areas)
+        return list(compress(self.names, selected))
+
+    # (name, area) pairs of the k largest shapes, largest first
+    def top_k(self, k):
+        largest = heapq.nlargest(k, range(len(self.areas)), key=self.areas.__getitem__)
+        return [(self.names[i], self.areas[i]) for i in largest]
+
+
+table = ShapeTable()
+table.add_circles(["small circle", "big circle"], [1.0, 10.0])
+table.add_rectangles(["square"], [4.0], [4.0])
+table.add_shapes(["blob"], [7.5])
+print(table.total_area())  # Output: 340.64
+print(table.filter_by_area(5, 20))  # Output: ['square', 'blob']
+print(table.top_k(2))  # Output: [('big circle', 314.0), ('square', 16.0)]
+
+blob = Shape.create_shape("blob", 7.5)
+print(blob.area(), hasattr(blob, "__dict__"))  # Output: 7.5 False
+
+catalog = [Circle.create_shape("unit circle", 1, shared=True) for _ in range(1000)]
+catalog += [Rectangle.create_shape("tile", 2, 3, shared=True) for _ in range(1000)]
+print(catalog[0] is catalog[999], len({id(shape) for shape in catalog}))  # Output: True 2
+print(Shape.flyweights.stats())  # Output: {'hits': 1998, 'misses': 2, 'evictions': 0, 'size': 2}
@@ -1,3 +1,8 @@
+import mmap
+import os
+import struct
+
+
 class DataContainer:
     def __init__(self, data_array):
         self.data_array = data_array
@@ -13,21 +18,147 @@ class DataContainer:
 
     # Define access methods for each element of the array
 
+
+class StructField:
+    """Descriptor that decodes one field of a packed record when it is read."""
+
+    def __init__(self, code, offset, byte_order):
+        self._struct = struct.Struct(byte_order + code)
+        self._offset = offset
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self._struct.unpack_from(instance._buffer, instance._offset + self._offset)[0]
+
+
+class StructDataContainer(DataContainer):
+    """
+    DataContainer over one record of a binary buffer (bytes, bytearray, mmap or
+    memoryview). Nothing is copied at construction time: each element is decoded
+    from the buffer on access. Subclasses describe their own record by
+    overriding `fields` and `byte_order`.
+    """
+
+    byte_order = "<"
+    fields = (("element_1", "q"), ("element_2", "q"))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._install_fields()
+
+    @classmethod
+    def _install_fields(cls):
+        codes = ""
+        for name, code in cls.fields:
+            # Measured with the field appended, so native alignment padding before it is included
+            offset = struct.calcsize(cls.byte_order + codes + code) - struct.calcsize(cls.byte_order + code)
+            setattr(cls, name, StructField(code, offset, cls.byte_order))
+            codes += code
+        cls.record_size = struct.calcsize(cls.byte_order + codes)
+
+    def __init__(self, buffer, offset=0):
+        self._buffer = buffer
+        self._offset = offset
+
+    @property
+    def data_array(self):
+        return self._buffer[self._offset:self._offset + self.record_size]
+
+
+StructDataContainer._install_fields()
+
+
+class RecordArray:
+    """
+    Sequence of fixed-size records laid out back to back in a buffer or a
+    memory-mapped file, exposed as StructDataContainer views.
+    """
+
+    def __init__(self, buffer, container_class=StructDataContainer):
+        self._buffer = memoryview(buffer)
+        self._mmap = None
+        self.container_class = container_class
+
+    @classmethod
+    def from_file(cls, path, container_class=StructDataContainer):
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # mmap cannot map an empty file, but zero records is a valid file
+                return cls(b"", container_class)
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        records = cls(mapping, container_class)
+        records._mmap = mapping
+        return records
+
+    def close(self):
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._buffer.nbytes // self.container_class.record_size
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        return self.container_class(self._buffer, index * self.container_class.record_size)
+
+    def __iter__(self):
+        for offset in range(0, len(self) * self.container_class.record_size, self.container_class.record_size):
+            yield self.container_class(self._buffer, offset)
+
+    def scan(self):
+        """
+        Iterate with a single container that is moved from record to record.
+        Nothing is allocated per record, so the yielded container is only
+        valid until the next step.
+        """
+        cursor = self.container_class(self._buffer)
+        for offset in range(0, len(self) * self.container_class.record_size, self.container_class.record_size):
+            cursor._offset = offset
+            yield cursor
+
+
 class OriginalClass:
     def __init__(self, data_array):
-        self.data_container = DataContainer(data_array)
+        # A ready-made container (e.g. a view into a record file) is used as is
+        if isinstance(data_array, DataContainer):
+            self.data_container = data_array
+        else:
+            self.data_container = DataContainer(data_array)
 
     def process_data(self):
         # Access array elements through access methods of DataContainer
         element_1 = self.data_container.get_element_1()
         element_2 = self.data_container.get_element_2()
         # Use element_1 and element_2 as needed in the main code
+        return element_1, element_2
+
+    # Process every record of a RecordArray without copying or allocating per record
+    @classmethod
+    def process_records(cls, records):
+        instance = cls.__new__(cls)
+        for container in records.scan():
+            instance.data_container = container
+            yield instance.process_data()
 
 # Usage:
 data_array = [1, 2]  # Example data array
 original_instance = OriginalClass(data_array)
 original_instance.process_data()
 
+# Usage over packed binary records (a file works the same way via RecordArray.from_file):
+packed = struct.pack("<6q", 1, 2, 3, 4, 5, 6)
+with RecordArray(packed) as records:
+    print(list(OriginalClass.process_records(records)))  # Output: [(1, 2), (3, 4), (5, 6)]
+
 # Create a new class and give it a new name that corresponds to the purpose of the coded type. Here we will call it type class.
 
 # Copy the field containing type code to the type class and make it private. Then create a getter for the field. A value will be set for this field only from the constructor.
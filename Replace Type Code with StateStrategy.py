@@ -5,27 +5,40 @@
 # Replace type code with a state object. If it is necessary to replace a field value with type code, another state object is “plugged in”.
 
 from abc import ABC, abstractmethod
+from timeit import timeit
 
 # Step 2: Create a new class for representing states/strategies
 class State(ABC):
+    # type code -> shared state instance. States hold no per-object data,
+    # so one instance per type code can be plugged into any number of objects.
+    _registry = {}
+
     @abstractmethod
     def get_type_code_value(self):
         pass
 
+    # Class decorator that plugs a new type code into the factory
+    @staticmethod
+    def register(type_code):
+        def decorator(state_class):
+            State._registry[type_code] = state_class()
+            return state_class
+        return decorator
+
     @staticmethod
     def create_state(type_code):
-        if type_code == 'A':
-            return StateA()
-        elif type_code == 'B':
-            return StateB()
-        else:
-            raise ValueError("Invalid type code")
+        try:
+            return State._registry[type_code]
+        except KeyError:
+            raise ValueError("Invalid type code") from None
 
 # Step 3: Create subclasses for each value of the type code
+@State.register('A')
 class StateA(State):
     def get_type_code_value(self):
         return "State A"
 
+@State.register('B')
 class StateB(State):
     def get_type_code_value(self):
         return "State B"
@@ -49,3 +62,27 @@ print(obj.get_type_code())  # Output: State A
 
 obj.set_type_code('B')
 print(obj.get_type_code())  # Output: State B
+
+
+# Benchmark: set_type_code throughput against the original if/elif factory,
+# which allocated a new state object on every call
+def benchmark_set_type_code(calls=1_000_000):
+    def create_state_with_conditional(type_code):
+        if type_code == 'A':
+            return StateA()
+        elif type_code == 'B':
+            return StateB()
+        else:
+            raise ValueError("Invalid type code")
+
+    class ConditionalMyClass(MyClass):
+        def set_type_code(self, type_code):
+            self._state = create_state_with_conditional(type_code)
+
+    for name, obj in (("if/elif", ConditionalMyClass('A')), ("registry", MyClass('A'))):
+        seconds = timeit(lambda: obj.set_type_code('B'), number=calls)
+        print(f"{name}: {calls / seconds:,.0f} set_type_code calls/s")
+
+
+if __name__ == "__main__":
+    benchmark_set_type_code()
@@ -1,4 +1,12 @@
+import csv
+import multiprocessing
+import os
+import sys
+import time
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from itertools import islice
 
 class Employee(ABC):
     def __init__(self, name):
@@ -6,14 +14,11 @@ class Employee(ABC):
 
     @staticmethod
     def create_employee(name, employee_type):
-        if employee_type == "Engineer":
-            return Engineer(name)
-        elif employee_type == "Manager":
-            return Manager(name)
-        elif employee_type == "Salesman":
-            return Salesman(name)
-        else:
-            raise ValueError("Invalid employee type")
+        try:
+            employee_class = EMPLOYEE_CLASSES[employee_type]
+        except KeyError:
+            raise ValueError("Invalid employee type") from None
+        return employee_class(name)
 
     @abstractmethod
     def calculate_salary(self):
@@ -53,14 +58,217 @@ class Salesman(Employee):
     def get_employee_type(self):
         return "Salesman"
 
-# Usage:
-employee1 = Employee.create_employee("Alice", "Engineer")
-employee2 = Employee.create_employee("Bob", "Manager")
-employee3 = Employee.create_employee("Charlie", "Salesman")
+EMPLOYEE_CLASSES = {"Engineer": Engineer, "Manager": Manager, "Salesman": Salesman}
 
-print(employee1.get_employee_type(), ":", employee1.calculate_salary())
-print(employee2.get_employee_type(), ":", employee2.calculate_salary())
-print(employee3.get_employee_type(), ":", employee3.calculate_salary())
+
+class EmployeeStore:
+    """
+    Columnar payroll storage: interned names plus one small integer type code
+    per employee. Payroll is computed from per-type counts in a single pass over
+    the code array instead of calling calculate_salary() on every object.
+    """
+
+    TYPES = tuple(EMPLOYEE_CLASSES)
+    CODES = {employee_type: code for code, employee_type in enumerate(TYPES)}
+    # Salaries only depend on the employee type, so one sample per type is enough
+    SALARIES = tuple(Employee.create_employee("", employee_type).calculate_salary() for employee_type in TYPES)
+
+    REMOVED = 255  # Type code of a removed row, ignored by all aggregates
+
+    def __init__(self):
+        self.names = []
+        self.type_codes = array("B")
+        self._removed = 0
+
+    # Number of current employees (removed rows are not counted)
+    def __len__(self):
+        return len(self.type_codes) - self._removed
+
+    # Employees are addressed by row index, which stays stable when others are removed
+    def __getitem__(self, index):
+        return Employee.create_employee(self.names[index], self.TYPES[self._current_code(index)])
+
+    def __iter__(self):
+        for name, code in zip(self.names, self.type_codes):
+            if code != self.REMOVED:
+                yield Employee.create_employee(name, self.TYPES[code])
+
+    def _current_code(self, index):
+        code = self.type_codes[index]
+        if code == self.REMOVED:
+            raise ValueError(f"Employee {index} has been removed")
+        return code
+
+    def _code(self, employee_type):
+        try:
+            return self.CODES[employee_type]
+        except KeyError:
+            raise ValueError("Invalid employee type") from None
+
+    # Returns the row index of the new employee
+    def add(self, name, employee_type):
+        self.type_codes.append(self._code(employee_type))
+        self.names.append(sys.intern(name))
+        return len(self.type_codes) - 1
+
+    # Remove the employee at a row index, returns its former type code
+    def remove(self, index):
+        code = self._current_code(index)
+        self.type_codes[index] = self.REMOVED
+        self._removed += 1
+        return code
+
+    # Change the type of the employee at a row index, returns the former type code
+    def retype(self, index, employee_type):
+        new_code = self._code(employee_type)
+        code = self._current_code(index)
+        self.type_codes[index] = new_code
+        return code
+
+    # Bulk add from (name, employee_type) rows
+    def extend(self, rows):
+        for name, employee_type in rows:
+            self.add(name, employee_type)
+
+    def count_by_type(self):
+        counts = Counter(self.type_codes)
+        return {employee_type: counts[code] for code, employee_type in enumerate(self.TYPES)}
+
+    def payroll_by_type(self):
+        return {employee_type: count * salary
+                for (employee_type, count), salary in zip(self.count_by_type().items(), self.SALARIES)}
+
+    def total_payroll(self):
+        return sum(self.payroll_by_type().values())
+
+    # Skip blank lines and reject malformed rows, naming their line in the CSV
+    @classmethod
+    def _checked_rows(cls, rows, path):
+        for row in rows:
+            if not row:
+                continue
+            if len(row) != 2:
+                raise ValueError(f"{path}, line {rows.line_num}: expected name,employee_type, got {row!r}")
+            if row[1] not in cls.CODES:
+                raise ValueError(f"{path}, line {rows.line_num}: invalid employee type {row[1]!r}")
+            yield row
+
+    # Read a CSV with name,employee_type rows as a series of stores of at most chunk_size employees
+    @classmethod
+    def read_csv_chunks(cls, path, chunk_size=100_000):
+        with open(path, newline="") as file:
+            rows = csv.reader(file)
+            next(rows, None)  # Skip the header
+            checked_rows = cls._checked_rows(rows, path)
+            while True:
+                store = cls()
+                store.extend(islice(checked_rows, chunk_size))
+                if not store:
+                    return
+                yield store
+
+    # Payroll per type over a CSV of any size, holding one chunk in memory at a time
+    @classmethod
+    def payroll_from_csv(cls, path, chunk_size=100_000):
+        totals = dict.fromkeys(cls.TYPES, 0)
+        for store in cls.read_csv_chunks(path, chunk_size):
+            for employee_type, payroll in store.payroll_by_type().items():
+                totals[employee_type] += payroll
+        return totals
+
+
+# Worker for PayrollEngine.recompute: number of employees of each type in one shard of type codes
+def _count_type_codes(shard):
+    return [shard.count(code) for code in range(len(EmployeeStore.TYPES))]
+
+
+class PayrollEngine:
+    """
+    Payroll over an EmployeeStore with per-type aggregates kept up to date, so
+    adding, removing or re-typing one employee updates the totals in O(1).
+    A full recompute splits the type codes into shards across a process pool.
+    """
+
+    def __init__(self, store=None, processes=1):
+        self.store = store if store is not None else EmployeeStore()
+        self.recompute(processes)
+
+    def recompute(self, processes=None):
+        codes = self.store.type_codes
+        processes = processes or os.cpu_count()
+        if processes == 1 or not codes:
+            self._counts = _count_type_codes(codes.tobytes())
+            return
+        shard_size = -(-len(codes) // processes)
+        shards = [codes[start:start + shard_size].tobytes() for start in range(0, len(codes), shard_size)]
+        with multiprocessing.Pool(processes) as pool:
+            self._counts = [sum(counts) for counts in zip(*pool.map(_count_type_codes, shards))]
+
+    # Returns the row index of the new employee, used by remove() and retype()
+    def add(self, name, employee_type):
+        index = self.store.add(name, employee_type)
+        self._counts[self.store.type_codes[index]] += 1
+        return index
+
+    def remove(self, index):
+        self._counts[self.store.remove(index)] -= 1
+
+    def retype(self, index, employee_type):
+        self._counts[self.store.retype(index, employee_type)] -= 1
+        self._counts[self.store.type_codes[index]] += 1
+
+    def payroll_by_type(self):
+        return {employee_type: count * salary
+                for employee_type, count, salary in zip(EmployeeStore.TYPES, self._counts, EmployeeStore.SALARIES)}
+
+    def total_payroll(self):
+        return sum(self.payroll_by_type().values())
+
+
+# Benchmark: payroll for `size` employees, per object vs. sharded recompute vs. incremental updates
+def benchmark_payroll(size=10_000_000, updates=100_000):
+    pattern = array("B", range(len(EmployeeStore.TYPES)))
+    store = EmployeeStore()
+    store.type_codes = pattern * (size // len(pattern))
+    store.names = [""] * len(store.type_codes)
+
+    start = time.perf_counter()
+    total = sum(employee.calculate_salary() for employee in store)
+    print(f"per object: {total} in {time.perf_counter() - start:.2f}s")
+
+    for processes in sorted({1, 2, 4, os.cpu_count()}):
+        start = time.perf_counter()
+        engine = PayrollEngine(store, processes)
+        print(f"recompute with {processes} processes: {engine.total_payroll()} "
+              f"in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for index in range(updates):
+        engine.retype(index, EmployeeStore.TYPES[(index + 1) % len(EmployeeStore.TYPES)])
+    print(f"{updates} incremental retypes in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    # Usage:
+    employee1 = Employee.create_employee("Alice", "Engineer")
+    employee2 = Employee.create_employee("Bob", "Manager")
+    employee3 = Employee.create_employee("Charlie", "Salesman")
+
+    print(employee1.get_employee_type(), ":", employee1.calculate_salary())
+    print(employee2.get_employee_type(), ":", employee2.calculate_salary())
+    print(employee3.get_employee_type(), ":", employee3.calculate_salary())
+
+    store = EmployeeStore()
+    store.extend([("Alice", "Engineer"), ("Bob", "Manager"), ("Charlie", "Salesman"), ("Dave", "Engineer")])
+    print(store.payroll_by_type())  # Output: {'Engineer': 100000, 'Manager': 70000, 'Salesman': 60000}
+    print(store.total_payroll())  # Output: 230000
+
+    engine = PayrollEngine(store)
+    engine.retype(engine.add("Eve", "Salesman"), "Manager")
+    engine.remove(0)
+    print(engine.payroll_by_type())  # Output: {'Engineer': 50000, 'Manager': 140000, 'Salesman': 60000}
+
+    benchmark_payroll()
 
 
 
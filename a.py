@@ -1,3 +1,9 @@
+import sys
+from array import array
+from itertools import compress, repeat
+from operator import eq
+
+
 class ProductType:
     def __init__(self, type_code):
         self._type_code = type_code
@@ -6,13 +12,17 @@ class ProductType:
     def type_code(self):
         return self._type_code
 
+    # Product types are immutable, so every product of a type shares one instance
     @staticmethod
     def create_type_A():
-        return ProductType("A")
+        return _TYPE_A
 
     @staticmethod
     def create_type_B():
-        return ProductType("B")
+        return _TYPE_B
+
+_TYPE_A = ProductType("A")
+_TYPE_B = ProductType("B")
 
 class Product:
     def __init__(self, name, product_type):
@@ -36,6 +46,101 @@ class Product:
         else:
             raise ValueError("Invalid product type")
 
+class ProductCatalog:
+    """
+    Columnar storage for very large catalogs. Each product is a uint8 type code
+    plus an index into a pool of interned names; a per-type index of product
+    positions answers "all products of type B" without touching other rows,
+    and retyping works on the code array instead of Product setters.
+    """
+
+    TYPE_CODES = ("A", "B")
+
+    def __init__(self):
+        self._codes = {type_code: code for code, type_code in enumerate(self.TYPE_CODES)}
+        self._name_pool = []  # Distinct names, each stored once
+        self._name_ids = {}  # name -> position in _name_pool
+        self.name_ids = array("L")
+        self.type_codes = array("B")
+        self._index = {code: array("L") for code in self._codes.values()}  # Per-type product positions
+        self._index_valid = True
+
+    def __len__(self):
+        return len(self.type_codes)
+
+    def _code(self, type_code):
+        try:
+            return self._codes[type_code]
+        except KeyError:
+            raise ValueError("Invalid product type") from None
+
+    def _name_id(self, name):
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._name_pool)
+            self._name_pool.append(sys.intern(name))
+        return name_id
+
+    def add(self, name, type_code):
+        code = self._code(type_code)
+        position = len(self.type_codes)
+        self.name_ids.append(self._name_id(name))
+        self.type_codes.append(code)
+        if self._index_valid:
+            self._index[code].append(position)
+        return position
+
+    # Bulk add from (name, type_code) rows
+    def extend(self, rows):
+        for name, type_code in rows:
+            self.add(name, type_code)
+
+    def name(self, position):
+        return self._name_pool[self.name_ids[position]]
+
+    def product_type(self, position):
+        return self.TYPE_CODES[self.type_codes[position]]
+
+    # Materialize a single row as a Product
+    def __getitem__(self, position):
+        product = Product(self.name(position), None)
+        product.product_type = self.product_type(position)
+        return product
+
+    # Positions of all products of a type, in catalog order
+    def positions_of_type(self, type_code):
+        if not self._index_valid:
+            positions = range(len(self.type_codes))
+            for code, index in self._index.items():
+                index[:] = array("L", compress(positions, map(eq, self.type_codes, repeat(code))))
+            self._index_valid = True
+        return self._index[self._code(type_code)]
+
+    def names_of_type(self, type_code):
+        pool, name_ids = self._name_pool, self.name_ids
+        return [pool[name_ids[position]] for position in self.positions_of_type(type_code)]
+
+    # Retype the products at the given positions
+    def retype(self, positions, type_code):
+        code = self._code(type_code)
+        type_codes = self.type_codes
+        # Invalidate first, so the index is not left stale if a position is out of range
+        self._index_valid = False
+        for position in positions:
+            type_codes[position] = code
+
+    # Retype every product of one type, as a single pass over the code buffer
+    def retype_all(self, from_type_code, to_type_code):
+        from_code, to_code = self._code(from_type_code), self._code(to_type_code)
+        if from_code == to_code:
+            return
+        self.type_codes = array("B", self.type_codes.tobytes().replace(bytes((from_code,)), bytes((to_code,))))
+        if self._index_valid:
+            # Both position lists are sorted, so this is a linear merge
+            self._index[to_code] = array("L", sorted(self._index[to_code] + self._index[from_code]))
+        self._index[from_code] = array("L")
+
+
 # Example usage:
 product_a = Product("Product A", ProductType.create_type_A())
 print(product_a.name)             # Output: Product A
@@ -44,6 +149,14 @@ print(product_a.product_type)     # Output: A
 product_a.product_type = "B"
 print(product_a.product_type)     # Output: B
 
+catalog = ProductCatalog()
+catalog.extend([("Widget", "A"), ("Gadget", "B"), ("Widget", "B"), ("Gizmo", "A")])
+print(catalog.names_of_type("B"))  # Output: ['Gadget', 'Widget']
+catalog.retype([0], "B")
+print(catalog.names_of_type("B"))  # Output: ['Widget', 'Gadget', 'Widget']
+catalog.retype_all("B", "A")
+print(catalog.names_of_type("A"))  # Output: ['Widget', 'Gadget', 'Widget', 'Gizmo']
+
 
 #Create a new class and give it a new name that corresponds to the purpose of the coded type. Here we will call it type class.
 # Copy the field containing type code to the type class and make it private. Then create a getter for the field. A value will be set for this field only from the constructor.
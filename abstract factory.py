@@ -4,6 +4,11 @@ objects without specifying their concrete classes.
 """
 
 import abc
+import gc
+import threading
+import time
+import weakref
+from itertools import repeat
 
 
 class AbstractFactory(metaclass=abc.ABCMeta):
@@ -20,6 +25,27 @@ class AbstractFactory(metaclass=abc.ABCMeta):
     def create_product_b(self):
         pass
 
+    def create_product_a_batch(self, n):
+        """
+        Create n products of type A. Concrete factories can override this
+        with a bulk path that skips the per-product method dispatch.
+        """
+        return [self.create_product_a() for _ in range(n)]
+
+    def create_product_b_batch(self, n):
+        """
+        Create n products of type B. Concrete factories can override this
+        with a bulk path that skips the per-product method dispatch.
+        """
+        return [self.create_product_b() for _ in range(n)]
+
+
+def _build_batch(product_class, n):
+    """
+    Construct n instances of product_class with no per-product dispatch.
+    """
+    return [product_class() for _ in repeat(None, n)]
+
 
 class ConcreteFactory1(AbstractFactory):
     """
@@ -32,6 +58,12 @@ class ConcreteFactory1(AbstractFactory):
     def create_product_b(self):
         return ConcreteProductB1()
 
+    def create_product_a_batch(self, n):
+        return _build_batch(ConcreteProductA1, n)
+
+    def create_product_b_batch(self, n):
+        return _build_batch(ConcreteProductB1, n)
+
 
 class ConcreteFactory2(AbstractFactory):
     """
@@ -44,12 +76,171 @@ class ConcreteFactory2(AbstractFactory):
     def create_product_b(self):
         return ConcreteProductB2()
 
+    def create_product_a_batch(self, n):
+        return _build_batch(ConcreteProductA2, n)
+
+    def create_product_b_batch(self, n):
+        return _build_batch(ConcreteProductB2, n)
+
+
+class _PoolState:
+    """
+    Free lists and counters owned by a single thread.
+    """
+
+    __slots__ = ("free_a", "free_b", "reuses", "misses", "discards")
+
+    def __init__(self):
+        self.free_a = []
+        self.free_b = []
+        self.reuses = self.misses = self.discards = 0
+
+
+class _ThreadExit:
+    """
+    Only referenced from a thread's threading.local, so it is collected when
+    that thread exits.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_state(factory_ref, state):
+    factory = factory_ref()
+    if factory is not None:
+        factory._retire(state)
+
+
+class PooledFactory(AbstractFactory):
+    """
+    Wrap a concrete factory and recycle the products it creates.
+    Released products go to a free list owned by the releasing thread (so no
+    locking on the hot path) and are handed out again by later create calls
+    from that thread. Each free list holds at most max_pool_size products;
+    further releases, and the free lists of threads that have exited, go to
+    a shared free list that any thread falls back to. At most max_total_size
+    products sit in the pool as a whole.
+    Only products of the classes the wrapped factory creates are accepted,
+    and a product cannot be released again while it is in the pool.
+    """
+
+    def __init__(self, factory, max_pool_size=64, max_total_size=1024):
+        self._factory = factory
+        self.max_pool_size = max_pool_size
+        self.max_total_size = max_total_size
+        self._local = threading.local()
+        self._states = []
+        self._shared = _PoolState()  # Shared free lists plus the counters of exited threads
+        self._states_lock = threading.Lock()
+        self._product_kinds = {}  # Product class made by the factory -> "a" or "b"
+        self._pooled = set()  # ids of the products currently sitting in a free list
+
+    def _state(self):
+        try:
+            return self._local.state
+        except AttributeError:
+            state = self._local.state = _PoolState()
+            self._local.exit = _ThreadExit()
+            weakref.finalize(self._local.exit, _retire_state, weakref.ref(self), state)
+            with self._states_lock:
+                self._states.append(state)
+            return state
+
+    def _retire(self, state):
+        """
+        Fold the free lists and counters of an exited thread into the shared state.
+        """
+        with self._states_lock:
+            self._states.remove(state)
+            shared = self._shared
+            shared.free_a += state.free_a
+            shared.free_b += state.free_b
+            shared.reuses += state.reuses
+            shared.misses += state.misses
+            shared.discards += state.discards
+
+    def _take_shared(self, free_name):
+        with self._states_lock:
+            free = getattr(self._shared, free_name)
+            return free.pop() if free else None
+
+    def create_product_a(self):
+        state = self._state()
+        if state.free_a:
+            product = state.free_a.pop()
+        elif self._shared.free_a:
+            product = self._take_shared("free_a")
+        else:
+            product = None
+        if product is not None:
+            state.reuses += 1
+            self._pooled.discard(id(product))
+            return product
+        state.misses += 1
+        product = self._factory.create_product_a()
+        self._product_kinds[type(product)] = "a"
+        return product
+
+    def create_product_b(self):
+        state = self._state()
+        if state.free_b:
+            product = state.free_b.pop()
+        elif self._shared.free_b:
+            product = self._take_shared("free_b")
+        else:
+            product = None
+        if product is not None:
+            state.reuses += 1
+            self._pooled.discard(id(product))
+            return product
+        state.misses += 1
+        product = self._factory.create_product_b()
+        self._product_kinds[type(product)] = "b"
+        return product
+
+    def release(self, product):
+        """
+        Return a product to the pool. Products may define reset() to clear
+        any state before they are handed out again.
+        """
+        kind = self._product_kinds.get(type(product))
+        if kind is None:
+            raise ValueError(f"{type(product).__name__} is not a product of {type(self._factory).__name__}")
+        if id(product) in self._pooled:
+            raise ValueError("Product has already been released")
+        state = self._state()
+        if len(self._pooled) >= self.max_total_size:
+            state.discards += 1
+            return
+        reset = getattr(product, "reset", None)
+        if reset is not None:
+            reset()
+        self._pooled.add(id(product))
+        free = state.free_a if kind == "a" else state.free_b
+        if len(free) < self.max_pool_size:
+            free.append(product)
+            return
+        with self._states_lock:
+            (self._shared.free_a if kind == "a" else self._shared.free_b).append(product)
+
+    def stats(self):
+        """
+        Reuse, miss (each one allocates a new product) and discard counts
+        summed over all threads, including those that have exited.
+        """
+        with self._states_lock:
+            states = [self._shared, *self._states]
+        keys = ("reuses", "misses", "discards")
+        return {key: sum(getattr(state, key) for state in states) for key in keys}
+
 
 class AbstractProductA(metaclass=abc.ABCMeta):
     """
     Declare an interface for a type of product object.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def interface_a(self):
         pass
@@ -62,6 +253,8 @@ class ConcreteProductA1(AbstractProductA):
     Implement the AbstractProduct interface.
     """
 
+    __slots__ = ()
+
     def interface_a(self):
         pass
 
@@ -73,6 +266,8 @@ class ConcreteProductA2(AbstractProductA):
     Implement the AbstractProduct interface.
     """
 
+    __slots__ = ()
+
     def interface_a(self):
         pass
 
@@ -82,6 +277,8 @@ class AbstractProductB(metaclass=abc.ABCMeta):
     Declare an interface for a type of product object.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def interface_b(self):
         pass
@@ -94,6 +291,8 @@ class ConcreteProductB1(AbstractProductB):
     Implement the AbstractProduct interface.
     """
 
+    __slots__ = ()
+
     def interface_b(self):
         pass
 
@@ -105,6 +304,8 @@ class ConcreteProductB2(AbstractProductB):
     Implement the AbstractProduct interface.
     """
 
+    __slots__ = ()
+
     def interface_b(self):
         pass
 
@@ -117,5 +318,47 @@ def main():
         product_b.interface_b()
 
 
+def benchmark_pool(requests=1_000, products_per_request=1_000):
+    """
+    Compare a request loop that creates, uses and drops a batch of products
+    against the same loop over a PooledFactory, reporting latency and the
+    garbage collections triggered.
+    """
+    plain = ConcreteFactory1()
+    pooled = PooledFactory(ConcreteFactory1(), max_pool_size=products_per_request)
+    for name, factory in (("plain", plain), ("pooled", pooled)):
+        release = getattr(factory, "release", lambda product: None)
+        collections = sum(generation["collections"] for generation in gc.get_stats())
+        start = time.perf_counter()
+        for _ in range(requests):
+            products = [factory.create_product_a() for _ in range(products_per_request)]
+            for product in products:
+                product.interface_a()
+                release(product)
+        elapsed = time.perf_counter() - start
+        collections = sum(generation["collections"] for generation in gc.get_stats()) - collections
+        print(f"{name}: {elapsed / requests * 1e6:.0f} us/request, {collections} GC collections")
+    print(f"pool stats: {pooled.stats()}")
+
+
+def benchmark_batch(n=1_000_000):
+    """
+    Compare creating n products one create_product_a() call at a time
+    against a single create_product_a_batch(n) call.
+    """
+    for factory in (ConcreteFactory1(), ConcreteFactory2()):
+        start = time.perf_counter()
+        products = [factory.create_product_a() for _ in range(n)]
+        per_call = time.perf_counter() - start
+        del products
+        start = time.perf_counter()
+        products = factory.create_product_a_batch(n)
+        batch = time.perf_counter() - start
+        print(f"{type(factory).__name__}: per call {per_call:.3f}s, batch {batch:.3f}s "
+              f"for {len(products)} products")
+
+
 if __name__ == "__main__":
     main()
+    benchmark_pool()
+    benchmark_batch()
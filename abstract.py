@@ -1,5 +1,10 @@
 from __future__ import annotations
+import asyncio
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
 
 
 class Creator(ABC):
@@ -86,6 +91,219 @@ class ConcreteProduct2(Product):
         return "{Result of the ConcreteProduct2}"
 
 
+class ProductContainer:
+    """
+    A small dependency container around Creators, for products that are
+    expensive to construct. Each registered Creator gets a lifetime:
+
+    - transient: a new product on every resolve
+    - singleton: one product for the whole process
+    - thread: one product per thread
+    - request: one product per `with container.request_scope():` block
+
+    The resolution plan for each registration is compiled into a closure once,
+    so resolving a cached product costs about a dict lookup.
+    """
+
+    LIFETIMES = ("transient", "singleton", "thread", "request")
+
+    def __init__(self) -> None:
+        self._plans: Dict[Hashable, Callable[[], Product]] = {}
+        self._stats = {lifetime: {"hits": 0, "misses": 0} for lifetime in self.LIFETIMES}
+        self._scopes = threading.local()
+
+    def register(self, creator: Creator, lifetime: str = "transient", key: Hashable = None) -> None:
+        """
+        Register a creator under `key` (its class by default).
+        """
+        if lifetime not in self.LIFETIMES:
+            raise ValueError(f"Unknown lifetime: {lifetime}")
+        key = type(creator) if key is None else key
+        compile_plan = getattr(self, f"_compile_{lifetime}")
+        self._plans[key] = compile_plan(key, creator.factory_method, self._stats[lifetime])
+
+    def resolve(self, key: Hashable) -> Product:
+        return self._plans[key]()
+
+    def plan(self, key: Hashable) -> Callable[[], Product]:
+        """
+        The compiled resolver for `key`, for callers that resolve it repeatedly.
+        """
+        return self._plans[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Cache hits and misses (products built) per lifetime.
+        """
+        return {lifetime: dict(counts) for lifetime, counts in self._stats.items()}
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        """
+        Request-scoped products resolved inside this block are shared within
+        it and dropped when it exits. Scopes are per thread and may nest.
+        """
+        outer = getattr(self._scopes, "request", None)
+        self._scopes.request = {}
+        try:
+            yield
+        finally:
+            self._scopes.request = outer
+
+    @staticmethod
+    def _compile_transient(key, factory, stats):
+        def plan():
+            stats["misses"] += 1
+            return factory()
+        return plan
+
+    @staticmethod
+    def _compile_singleton(key, factory, stats):
+        lock = threading.Lock()
+        cache = []
+
+        def plan():
+            if cache:
+                stats["hits"] += 1
+                return cache[0]
+            with lock:
+                if not cache:
+                    stats["misses"] += 1
+                    cache.append(factory())
+                else:
+                    stats["hits"] += 1
+            return cache[0]
+        return plan
+
+    @staticmethod
+    def _compile_thread(key, factory, stats):
+        local = threading.local()
+
+        def plan():
+            try:
+                product = local.product
+            except AttributeError:
+                stats["misses"] += 1
+                product = local.product = factory()
+                return product
+            stats["hits"] += 1
+            return product
+        return plan
+
+    def _compile_request(self, key, factory, stats):
+        scopes = self._scopes
+
+        def plan():
+            cache = getattr(scopes, "request", None)
+            if cache is None:
+                raise RuntimeError(f"{key!r} is request-scoped, resolve it inside request_scope()")
+            try:
+                product = cache[key]
+            except KeyError:
+                stats["misses"] += 1
+                product = cache[key] = factory()
+                return product
+            stats["hits"] += 1
+            return product
+        return plan
+
+
+class ContainerCreator(Creator):
+    """
+    Creator whose factory method resolves its product from a ProductContainer,
+    so some_operation() reuses cached products according to their lifetime.
+    """
+
+    def __init__(self, container: ProductContainer, key: Hashable) -> None:
+        self._resolve = container.plan(key)
+
+    def factory_method(self) -> Product:
+        return self._resolve()
+
+
+class AsyncCreator(ABC):
+    """
+    Async variant of the Creator for factories that wait on I/O (reading
+    configuration from disk, a local socket, ...) before they can build a
+    product. Many constructions overlap on one event loop; at most
+    `max_concurrency` of them run at the same time on each loop.
+    """
+
+    def __init__(self, max_concurrency: int = 100) -> None:
+        self._max_concurrency = max_concurrency
+        self._limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def _limit(self) -> asyncio.Semaphore:
+        """
+        A semaphore is bound to the loop it is first used on, so each running
+        loop gets its own.
+        """
+        loop = asyncio.get_running_loop()
+        limit = self._limits.get(loop)
+        if limit is None:
+            limit = self._limits[loop] = asyncio.Semaphore(self._max_concurrency)
+        return limit
+
+    @abstractmethod
+    async def factory_method(self) -> Product:
+        pass
+
+    async def some_operation(self) -> str:
+        """
+        Same business logic as Creator.some_operation. Cancelling the calling
+        task cancels the construction and frees its concurrency slot.
+        """
+
+        async with self._limit:
+            product = await self.factory_method()
+
+        result = f"Creator: The same creator's code has just worked with {product.operation()}"
+
+        return result
+
+    async def some_operations(self, count: int, timeout: Optional[float] = None) -> List[str]:
+        """
+        Run `count` operations concurrently and return their results in order.
+        If one fails or the timeout expires, the rest are cancelled.
+        """
+        tasks = [asyncio.ensure_future(self.some_operation()) for _ in range(count)]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        except BaseException:
+            # gather() does not cancel the other tasks when one fails
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+class ThreadedAsyncCreator(AsyncCreator):
+    """
+    Runs a blocking Creator's factory method in a worker thread, so existing
+    synchronous creators can be used from the event loop.
+    """
+
+    def __init__(self, creator: Creator, max_concurrency: int = 100) -> None:
+        super().__init__(max_concurrency)
+        self._creator = creator
+
+    async def factory_method(self) -> Product:
+        return await asyncio.to_thread(self._creator.factory_method)
+
+
+class ConcreteAsyncCreator1(AsyncCreator):
+    async def factory_method(self) -> Product:
+        await asyncio.sleep(0.01)  # Stands in for loading the product's configuration
+        return ConcreteProduct1()
+
+
+class ConcreteAsyncCreator2(AsyncCreator):
+    async def factory_method(self) -> Product:
+        await asyncio.sleep(0.01)
+        return ConcreteProduct2()
+
+
 def client_code(creator: Creator) -> None:
     """
     The client code works with an instance of a concrete creator, albeit through
@@ -103,4 +321,24 @@ if __name__ == "__main__":
     print("\n")
 
     print("App: Launched with the ConcreteCreator2.")
-    client_code(ConcreteCreator2())
\ No newline at end of file
+    client_code(ConcreteCreator2())
+    print("\n")
+
+    print("App: Launched with products cached by a ProductContainer.")
+    container = ProductContainer()
+    container.register(ConcreteCreator1(), "singleton")
+    container.register(ConcreteCreator2(), "request")
+    for _ in range(3):
+        client_code(ContainerCreator(container, ConcreteCreator1))
+        print()
+    with container.request_scope():
+        client_code(ContainerCreator(container, ConcreteCreator2))
+        print()
+        client_code(ContainerCreator(container, ConcreteCreator2))
+        print()
+    print(container.stats())
+    print("\n")
+
+    print("App: Launched with the ConcreteAsyncCreator1.")
+    results = asyncio.run(ConcreteAsyncCreator1(max_concurrency=50).some_operations(500))
+    print(f"{len(results)} products built concurrently, first: {results[0]}")
\ No newline at end of file
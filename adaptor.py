@@ -7,6 +7,13 @@
 
 #  Use the Adapter class when you want to use some existing class, but its interface isn’t compatible with the rest of your code.
 
+import io
+import os
+import inspect
+import keyword
+from timeit import timeit
+from typing import Callable, Dict, NamedTuple, Optional
+
 class Target:
     """
     The Target defines the domain-specific interface used by the client code.
@@ -37,6 +44,192 @@ class Adapter(Target, Adaptee):
         return f"Adapter: (TRANSLATED) {self.specific_request()[::-1]}"
 
 
+class StreamingAdapter(Target):
+    """
+    Streaming variant of the Adapter for large Adaptee payloads. Instead of
+    materializing the reversed string, it reads the payload backwards in
+    chunks from a buffer or a seekable binary file and writes each translated
+    chunk straight to a sink, reusing two chunk-sized buffers. Peak memory is
+    bounded by `chunk_size`, not by the payload size.
+
+    The payload is UTF-8 and is translated character by character, which
+    matches Adapter.request(). Chunk starts are moved forward to a character
+    boundary; pure ASCII chunks are reversed in place, other chunks are
+    decoded and reversed as text.
+    """
+
+    PREFIX = b"Adapter: (TRANSLATED) "
+
+    def __init__(self, source, chunk_size: int = 64 * 1024) -> None:
+        if chunk_size < 4:
+            raise ValueError("chunk_size must hold at least one UTF-8 character (4 bytes)")
+        self.source = source
+        self.chunk_size = chunk_size
+
+    def _translated_chunks(self):
+        """
+        Yield the translated payload chunk by chunk. ASCII chunks are views
+        into one reused buffer (each view is only valid until the next step).
+        """
+        translated = bytearray(self.chunk_size)
+        translated_view = memoryview(translated)
+        if hasattr(self.source, "readinto"):
+            raw_view = memoryview(bytearray(self.chunk_size))
+            end = self.source.seek(0, os.SEEK_END)
+        else:
+            payload = memoryview(self.source).cast("B")
+            end = payload.nbytes
+
+        while end > 0:
+            start = max(0, end - self.chunk_size)
+            if hasattr(self.source, "readinto"):
+                self.source.seek(start)
+                self.source.readinto(raw_view[:end - start])
+                raw = raw_view[:end - start]
+            else:
+                raw = payload[start:end]
+            # Skip UTF-8 continuation bytes, their lead byte belongs to the next chunk
+            offset = 0
+            if start > 0:
+                while raw[offset] & 0xC0 == 0x80:
+                    offset += 1
+            raw = raw[offset:]
+            size = len(raw)
+            translated[:size] = raw[::-1]
+            if (translated if size == self.chunk_size else translated_view[:size].tobytes()).isascii():
+                yield translated_view[:size]
+            else:
+                yield str(raw, "utf-8")[::-1].encode()
+            end = start + offset
+
+    def request_into(self, sink) -> int:
+        """
+        Write the translated payload to a binary sink, return the bytes written.
+        """
+        written = sink.write(self.PREFIX)
+        for chunk in self._translated_chunks():
+            written += sink.write(chunk)
+        return written
+
+    def request(self) -> str:
+        sink = io.BytesIO()
+        self.request_into(sink)
+        return sink.getvalue().decode()
+
+
+class AdaptedMethod(NamedTuple):
+    """
+    Declares how one Target method maps onto the Adaptee: the Adaptee method
+    to call, an optional transform for the arguments (returning the argument
+    tuple to pass on) and an optional transform for the result.
+    """
+
+    adaptee_method: str
+    args: Optional[Callable] = None
+    result: Optional[Callable] = None
+
+
+def _forwarding_signature(function: Callable):
+    """
+    Parameter list (without self, defaults or annotations) and the matching
+    argument list for a function that forwards every parameter unchanged.
+    """
+    parameters, arguments = [], []
+    for parameter in list(inspect.signature(function).parameters.values())[1:]:
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            parameters.append(f"*{parameter.name}")
+            arguments.append(f"*{parameter.name}")
+        elif parameter.kind is parameter.VAR_KEYWORD:
+            parameters.append(f"**{parameter.name}")
+            arguments.append(f"**{parameter.name}")
+        elif parameter.kind is parameter.KEYWORD_ONLY:
+            if not any(p.startswith("*") for p in parameters):
+                parameters.append("*")
+            parameters.append(parameter.name)
+            arguments.append(f"{parameter.name}={parameter.name}")
+        else:
+            parameters.append(parameter.name)
+            arguments.append(parameter.name)
+    return ", ".join(["self"] + parameters), ", ".join(arguments)
+
+
+def _is_plain_identifier(name) -> bool:
+    """
+    Names are pasted into generated source, so they must be identifiers.
+    """
+    return isinstance(name, str) and name.isidentifier() and not keyword.iskeyword(name)
+
+
+def make_adapter(target: type, mapping: Dict[str, AdaptedMethod], name: str = "GeneratedAdapter") -> type:
+    """
+    Generate an Adapter class from a declarative mapping of Target methods to
+    Adaptee methods. Every method is compiled once, when the class is created,
+    into a plain function with the Target method's own parameters that calls
+    the Adaptee directly. An adapted call therefore costs about as much as a
+    hand-written Adapter and avoids the per-call lookup of `__getattr__`
+    forwarding.
+
+    The generated class wraps an Adaptee instance: `adapter = cls(adaptee)`.
+    """
+    for method_name, adapted in mapping.items():
+        if not _is_plain_identifier(method_name) or method_name.startswith("__") and method_name.endswith("__"):
+            raise ValueError(f"Cannot generate an adapter method named {method_name!r}")
+        if not _is_plain_identifier(adapted.adaptee_method):
+            raise ValueError(f"Invalid Adaptee method name {adapted.adaptee_method!r}")
+
+    namespace = {}
+    source = ["def __init__(self, adaptee):", "    self._adaptee = adaptee"]
+    defaults = {}
+    for method_name, adapted in mapping.items():
+        target_method = getattr(target, method_name, None)
+        if not callable(target_method):
+            raise ValueError(f"{target.__name__} has no method {method_name!r}")
+        parameters, arguments = _forwarding_signature(target_method)
+        if adapted.args:
+            namespace[f"_{method_name}_args"] = adapted.args
+            arguments = f"*_{method_name}_args({arguments})"
+        call = f"self._adaptee.{adapted.adaptee_method}({arguments})"
+        if adapted.result:
+            namespace[f"_{method_name}_result"] = adapted.result
+            call = f"_{method_name}_result({call})"
+        source += [f"def {method_name}({parameters}):", f"    return {call}"]
+        defaults[method_name] = target_method
+    exec("\n".join(source), namespace)
+
+    attributes = {"__init__": namespace["__init__"], "__slots__": ("_adaptee",)}
+    for method_name, target_method in defaults.items():
+        method = namespace[method_name]
+        method.__defaults__ = target_method.__defaults__
+        method.__kwdefaults__ = target_method.__kwdefaults__
+        method.__doc__ = target_method.__doc__
+        attributes[method_name] = method
+    return type(name, (target,), attributes)
+
+
+def benchmark_generated_adapter(calls=1_000_000) -> None:
+    """
+    Compare a direct Adaptee call, a generated adapter and generic
+    `__getattr__` forwarding, all without transforms so only the dispatch
+    cost differs.
+    """
+    mapping = {"request": AdaptedMethod("specific_request")}
+
+    class GetattrAdapter:
+        def __init__(self, adaptee):
+            self._adaptee = adaptee
+
+        def __getattr__(self, name):
+            return getattr(self._adaptee, mapping[name].adaptee_method)
+
+    adaptee = Adaptee()
+    generated = make_adapter(Target, mapping)(adaptee)
+    forwarding = GetattrAdapter(adaptee)
+    for label, call in (("direct", lambda: adaptee.specific_request()),
+                        ("generated", lambda: generated.request()),
+                        ("__getattr__", lambda: forwarding.request())):
+        print(f"{label}: {timeit(call, number=calls) / calls * 1e9:.0f} ns/call")
+
+
 def client_code(target: "Target") -> None:
     """
     The client code supports all classes that follow the Target interface.
@@ -59,4 +252,19 @@ if __name__ == "__main__":
     print("Client: But I can work with it via the Adapter:")
     adapter = Adapter()
     client_code(adapter)
+    print("\n")
+
+    print("Client: Large payloads can be streamed through the StreamingAdapter:")
+    payload = io.BytesIO(adaptee.specific_request().encode())
+    client_code(StreamingAdapter(payload, chunk_size=8))
+    print("\n")
+
+    print("Client: Or via an Adapter generated from a declarative mapping:")
+    GeneratedAdapter = make_adapter(Target, {
+        "request": AdaptedMethod("specific_request", result=lambda text: f"Adapter: (TRANSLATED) {text[::-1]}"),
+    })
+    client_code(GeneratedAdapter(adaptee))
+    print("\n")
+
+    benchmark_generated_adapter()
 
@@ -1,7 +1,18 @@
 # Bridge is a structural design pattern that divides business logic or huge class into separate class hierarchies that can be developed independently.
 
 from __future__ import annotations
+import bisect
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from timeit import Timer
+from typing import Callable, Dict, List, Optional, Sequence, Type
 
 
 class Abstraction:
@@ -15,8 +26,18 @@ class Abstraction:
         self.implementation = implementation
 
     def operation(self) -> str:
+        return self._describe(self.implementation.operation_implementation())
+
+    def operation_many(self, count: int) -> List[str]:
+        """
+        Run `count` operations. The implementation receives them as one batch,
+        so backends that run elsewhere avoid a round trip per operation.
+        """
+        return [self._describe(result) for result in self.implementation.operation_implementation_many(count)]
+
+    def _describe(self, result: str) -> str:
         return (f"Abstraction: Base operation with:\n"
-                f"{self.implementation.operation_implementation()}")
+                f"{result}")
 
 
 class ExtendedAbstraction(Abstraction):
@@ -24,9 +45,9 @@ class ExtendedAbstraction(Abstraction):
     You can extend the Abstraction without changing the Implementation classes.
     """
 
-    def operation(self) -> str:
+    def _describe(self, result: str) -> str:
         return (f"ExtendedAbstraction: Extended operation with:\n"
-                f"{self.implementation.operation_implementation()}")
+                f"{result}")
 
 
 class Implementation(ABC):
@@ -38,10 +59,25 @@ class Implementation(ABC):
     level operations based on those primitives.
     """
 
+    registry: List[Type[Implementation]] = []
+
+    def __init_subclass__(cls, register: bool = True, **kwargs) -> None:
+        """
+        Implementations register themselves, so tools such as the
+        AutotunedAbstraction can discover every available platform. Wrappers
+        around other implementations opt out with `register=False`.
+        """
+        super().__init_subclass__(**kwargs)
+        if register:
+            Implementation.registry.append(cls)
+
     @abstractmethod
     def operation_implementation(self) -> str:
         pass
 
+    def operation_implementation_many(self, count: int) -> List[str]:
+        return [self.operation_implementation() for _ in range(count)]
+
 
 """
 Each Concrete Implementation corresponds to a specific platform and implements
@@ -59,6 +95,201 @@ class ConcreteImplementationB(Implementation):
         return "ConcreteImplementationB: Here's the result on the platform B."
 
 
+# The implementation owned by a ProcessPoolImplementation worker process
+_worker_implementation: Optional[Implementation] = None
+
+
+def _init_worker(implementation_class: Type[Implementation]) -> None:
+    global _worker_implementation
+    _worker_implementation = implementation_class()
+
+
+def _run_batch(count: int) -> List[str]:
+    return _worker_implementation.operation_implementation_many(count)
+
+
+class ProcessPoolImplementation(Implementation, register=False):
+    """
+    Runs another Implementation in a pool of worker processes, so CPU-heavy
+    implementations are not limited to one core by the GIL. Each worker builds
+    its own instance of `implementation_class` (which must be importable by the
+    workers); batched requests are split into chunks of `batch_size` and sent
+    over the pool's pipes, one message per chunk. Results come back in order.
+    """
+
+    def __init__(self, implementation_class: Type[Implementation],
+                 processes: Optional[int] = None, batch_size: int = 256) -> None:
+        self._pool = multiprocessing.Pool(processes, _init_worker, (implementation_class,))
+        self.batch_size = batch_size
+
+    def operation_implementation(self) -> str:
+        return self._pool.apply(_run_batch, (1,))[0]
+
+    def operation_implementation_many(self, count: int) -> List[str]:
+        batches = [min(self.batch_size, count - start) for start in range(0, count, self.batch_size)]
+        return [result for batch in self._pool.map(_run_batch, batches, chunksize=1) for result in batch]
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> ProcessPoolImplementation:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _default_workload(implementation: Implementation, size: int) -> None:
+    for _ in range(size):
+        implementation.operation_implementation()
+
+
+class AutotunedAbstraction(Abstraction):
+    """
+    An Abstraction that picks its Implementation per input size. On first use
+    it benchmarks every candidate implementation on a sample workload for each
+    size bucket, keeps the fastest one per bucket and saves the decision to a
+    local cache file, so later process starts on the same host skip the
+    calibration step.
+
+    `workload(implementation, size)` runs a representative piece of work of
+    the given size; `sample_sizes` are the lower bounds of the buckets.
+    """
+
+    DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "bridge-autotune.json")
+
+    def __init__(self,
+                 implementations: Optional[Sequence[Type[Implementation]]] = None,
+                 workload: Callable[[Implementation, int], object] = _default_workload,
+                 sample_sizes: Sequence[int] = (1, 64, 4096),
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH) -> None:
+        if implementations is None:
+            implementations = [cls for cls in Implementation.registry if not inspect.isabstract(cls)]
+        if not implementations:
+            raise ValueError("AutotunedAbstraction needs at least one candidate implementation")
+        self._instances = {cls.__name__: cls() for cls in implementations}
+        self._workload = workload
+        self._sample_sizes = sorted(sample_sizes)
+        self._cache_path = cache_path
+        self._choices: Optional[Dict[int, str]] = None
+        self._choices_lock = threading.Lock()
+        super().__init__(next(iter(self._instances.values())))
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Decisions are only reused on the same host, Python version and set of
+        candidate implementations.
+        """
+        return "|".join([platform.node(), platform.machine(), platform.python_implementation(),
+                         platform.python_version(), *sorted(self._instances)])
+
+    def calibrate(self, repeat: int = 3) -> Dict[int, str]:
+        """
+        Benchmark every implementation for every bucket and store the winners.
+        """
+        choices = {}
+        for size in self._sample_sizes:
+            timings = {}
+            for name, implementation in self._instances.items():
+                timer = Timer(lambda: self._workload(implementation, size))
+                timings[name] = min(timer.repeat(repeat=repeat, number=1))
+            choices[size] = min(timings, key=timings.get)
+        self._choices = choices
+        self._save_choices()
+        return choices
+
+    def _load_choices(self) -> Optional[Dict[int, str]]:
+        if self._cache_path is None:
+            return None
+        try:
+            with open(self._cache_path) as cache_file:
+                entry = json.load(cache_file).get(self.cache_key)
+        except (OSError, ValueError):
+            return None
+        if entry is None:
+            return None
+        choices = {int(size): name for size, name in entry.items()}
+        if sorted(choices) != self._sample_sizes or not set(choices.values()) <= set(self._instances):
+            return None
+        return choices
+
+    def _save_choices(self) -> None:
+        """
+        Best effort: if the cache cannot be written, the choices are only
+        kept in memory. The file is replaced atomically so concurrent
+        processes never read a partial cache.
+        """
+        if self._cache_path is None:
+            return
+        try:
+            with open(self._cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        cache[self.cache_key] = self._choices
+        cache_dir = os.path.dirname(self._cache_path) or "."
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(cache, cache_file, indent=2)
+            os.replace(temp_path, self._cache_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def select(self, size: int) -> Implementation:
+        """
+        The fastest implementation for inputs of this size.
+        """
+        if self._choices is None:
+            with self._choices_lock:
+                if self._choices is None:
+                    self._choices = self._load_choices() or self.calibrate()
+        bucket = self._sample_sizes[max(0, bisect.bisect_right(self._sample_sizes, size) - 1)]
+        return self._instances[self._choices[bucket]]
+
+    def operation(self, size: int = 1) -> str:
+        return self._describe(self.select(size).operation_implementation())
+
+    def operation_many(self, count: int) -> List[str]:
+        implementation = self.select(count)
+        return [self._describe(result) for result in implementation.operation_implementation_many(count)]
+
+
+class _CpuHeavyImplementation(Implementation, register=False):
+    """
+    Stand-in for an expensive implementation, used by benchmark_process_pool.
+    """
+
+    def operation_implementation(self) -> str:
+        return f"_CpuHeavyImplementation: {sum(i * i for i in range(20_000))}"
+
+
+def benchmark_process_pool(count: int = 2_000) -> None:
+    """
+    Throughput of operation_many in process, and over process pools of
+    1 to cpu_count workers.
+    """
+    start = time.perf_counter()
+    Abstraction(_CpuHeavyImplementation()).operation_many(count)
+    print(f"in process: {count / (time.perf_counter() - start):,.0f} operations/s")
+    for processes in range(1, (os.cpu_count() or 1) + 1):
+        with ProcessPoolImplementation(_CpuHeavyImplementation, processes, batch_size=64) as implementation:
+            start = time.perf_counter()
+            Abstraction(implementation).operation_many(count)
+            print(f"{processes} processes: {count / (time.perf_counter() - start):,.0f} operations/s")
+
+
 def client_code(abstraction: Abstraction) -> None:
     """
     Except for the initialization phase, where an Abstraction object gets linked
@@ -89,3 +320,20 @@ if __name__ == "__main__":
     implementation = ConcreteImplementationB()
     abstraction = ExtendedAbstraction(implementation)
     client_code(abstraction)
+
+    print("\n")
+
+    # The autotuned abstraction chooses among the registered implementations.
+    abstraction = AutotunedAbstraction()
+    client_code(abstraction)
+
+    print("\n")
+
+    # The same operations, run in worker processes and sent in batches.
+    with ProcessPoolImplementation(ConcreteImplementationB, processes=2) as implementation:
+        results = Abstraction(implementation).operation_many(1000)
+    print(f"{len(results)} results, last one:\n{results[-1]}")
+
+    print("\n")
+
+    benchmark_process_pool()
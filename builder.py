@@ -2,8 +2,12 @@
 # The pattern allows you to produce different types and representations of an object using the same construction code.
 
 from __future__ import annotations
+import copy
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, FrozenSet, List, Optional, TextIO, Tuple
 # director(control the steps and processes) -> builder (for adding procducts) 
 
 
@@ -31,7 +35,23 @@ class Builder(ABC):
         pass
 
 
-class ConcreteBuilder1(Builder):
+class ParallelBuilder(ABC):
+    """
+    Mixin for builders that support the ParallelDirector. Steps listed in
+    independent_steps only depend on the builder's inputs, not on the parts
+    built before them. For each such produce_part_x the builder also provides
+    make_part_x(), which returns the part without touching the product, and
+    add_part() assembles a part made that way.
+    """
+
+    independent_steps: FrozenSet[str] = frozenset()
+
+    @abstractmethod
+    def add_part(self, part: Any) -> None:
+        pass
+
+
+class ConcreteBuilder1(Builder, ParallelBuilder):
     """
     The Concrete Builder classes follow the Builder interface and provide
     specific implementations of the building steps. Your program may have
@@ -68,14 +88,28 @@ class ConcreteBuilder1(Builder):
         self.reset()
         return product
 
+    independent_steps = frozenset({"produce_part_a", "produce_part_b", "produce_part_c"})
+
+    def add_part(self, part: str) -> None:
+        self._product.add(part)
+
+    def make_part_a(self) -> str:
+        return "PartA1"
+
+    def make_part_b(self) -> str:
+        return "PartB1"
+
+    def make_part_c(self) -> str:
+        return "PartC1"
+
     def produce_part_a(self) -> None:
-        self._product.add("PartA1")
+        self.add_part(self.make_part_a())
 
     def produce_part_b(self) -> None:
-        self._product.add("PartB1")
+        self.add_part(self.make_part_b())
 
     def produce_part_c(self) -> None:
-        self._product.add("PartC1")
+        self.add_part(self.make_part_c())
 
 # product1 -> produce_part_a -> produce_part_b -> produce_part_c
 
@@ -98,6 +132,84 @@ class Product1():
     def list_parts(self) -> None:
         print(f"Product parts: {', '.join(self.parts)}", end="")
 
+    def clone(self) -> Product1:
+        clone = type(self).__new__(type(self))
+        clone.parts = self.parts.copy()
+        return clone
+
+
+class StreamingBuilder(Builder):
+    """
+    A Concrete Builder for very large products. Instead of collecting parts in
+    a list, every produce_part_* call writes its part to a text sink (a
+    buffered file, a socket wrapper, sys.stdout, ...) right away. Memory no
+    longer grows with the number of parts, and consumers can start reading
+    the product before it is complete.
+
+    With `flush_each_part`, the sink is flushed after every part so the bytes
+    are visible immediately instead of when the sink's buffer fills up.
+    """
+
+    def __init__(self, sink: TextIO, flush_each_part: bool = False) -> None:
+        self._sink = sink
+        self._flush_each_part = flush_each_part
+        self.reset()
+
+    def reset(self) -> None:
+        self._product = StreamedProduct(self._sink)
+
+    @property
+    def product(self) -> StreamedProduct:
+        """
+        Finish the product that is being streamed and start a new one.
+        """
+        product = self._product
+        product.finish()
+        self.reset()
+        return product
+
+    def _emit(self, part: str) -> None:
+        self._product.add(part)
+        if self._flush_each_part:
+            self._sink.flush()
+
+    def produce_part_a(self) -> None:
+        self._emit("PartA1")
+
+    def produce_part_b(self) -> None:
+        self._emit("PartB1")
+
+    def produce_part_c(self) -> None:
+        self._emit("PartC1")
+
+
+class StreamedProduct():
+    """
+    Product produced by the StreamingBuilder. Its parts have already been
+    written out in the same format as Product1.list_parts, so it only keeps
+    track of how many there were. For the same reason it cannot be cloned.
+    """
+
+    clone = None
+
+    def __init__(self, sink: TextIO) -> None:
+        self._sink = sink
+        self.part_count = 0
+
+    def add(self, part: Any) -> None:
+        self._sink.write(f"{', ' if self.part_count else 'Product parts: '}{part}")
+        self.part_count += 1
+
+    def finish(self) -> None:
+        if not self.part_count:
+            self._sink.write("Product parts: ")
+
+    def list_parts(self) -> None:
+        """
+        The parts are already in the sink, make sure they are visible.
+        """
+        self._sink.flush()
+
 
 class Director:
     """
@@ -136,6 +248,183 @@ class Director:
         self.builder.produce_part_b()
         self.builder.produce_part_c()
 
+    """
+    For mass production, the Director can record a build sequence once as a
+    Recipe, then compile it into a template product that is cloned for every
+    further copy instead of running the building steps again.
+    """
+
+    def record(self, build: Callable[[], None]) -> Recipe:
+        """
+        Record the building steps `build` (e.g. self.build_full_featured_product)
+        performs, without building anything.
+        """
+        builder = self._builder
+        recorder = _RecipeRecorder()
+        self._builder = recorder
+        try:
+            build()
+        finally:
+            self._builder = builder
+        return Recipe(tuple(recorder.steps))
+
+    def replay(self, recipe: Recipe) -> None:
+        for step in recipe.steps:
+            getattr(self.builder, step)()
+
+    def compile(self, recipe: Recipe) -> ProductTemplate:
+        """
+        Build the recipe once with the current builder and keep the result as
+        the template for all further copies.
+        """
+        self.replay(recipe)
+        return ProductTemplate(self.builder.product)
+
+
+class ParallelDirector(Director):
+    """
+    A Director for builders whose steps wait on files or local services. The
+    parts of all independent steps are made concurrently on a thread pool and
+    then assembled in the declared order, so a full build takes about as long
+    as its slowest step rather than the sum of all of them. Steps the builder
+    does not declare independent, and all steps of builders that are not
+    ParallelBuilders, run in order on the calling thread.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers)
+
+    def replay(self, recipe: Recipe) -> None:
+        builder = self.builder
+        if not isinstance(builder, ParallelBuilder):
+            super().replay(recipe)
+            return
+        makers = {}
+        for step in recipe.steps:
+            if step in builder.independent_steps:
+                maker = getattr(builder, "make_" + step[len("produce_"):], None)
+                if not step.startswith("produce_") or maker is None:
+                    raise TypeError(f"{type(builder).__name__} declares {step} independent "
+                                    f"but has no matching make_ method")
+                makers[step] = maker
+        pending = {step: self._executor.submit(maker) for step, maker in makers.items()}
+        for step in recipe.steps:
+            if step in pending:
+                builder.add_part(pending.pop(step).result())
+            else:
+                getattr(builder, step)()
+
+    def build_minimal_viable_product(self) -> None:
+        self.replay(self.record(super().build_minimal_viable_product))
+
+    def build_full_featured_product(self) -> None:
+        self.replay(self.record(super().build_full_featured_product))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> ParallelDirector:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class Recipe:
+    """
+    The sequence of building steps, by name, that makes one product.
+    """
+
+    def __init__(self, steps: Tuple[str, ...]) -> None:
+        self.steps = steps
+
+
+class _RecipeRecorder:
+    """
+    Stands in for the real builder while a Recipe is being recorded. Every
+    produce_* step the build calls is recorded by name, so builders with
+    steps beyond the Builder interface are recorded as well.
+    """
+
+    def __init__(self) -> None:
+        self.steps: List[str] = []
+
+    @property
+    def product(self) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Callable[[], None]:
+        if not name.startswith("produce_"):
+            raise AttributeError(name)
+        return lambda: self.steps.append(name)
+
+
+class SlowBuilder(ConcreteBuilder1):
+    """
+    A builder whose parts take a while to make, e.g. because they are read
+    from disk.
+    """
+
+    def make_part_a(self) -> str:
+        time.sleep(0.1)
+        return super().make_part_a()
+
+    def make_part_b(self) -> str:
+        time.sleep(0.1)
+        return super().make_part_b()
+
+    def make_part_c(self) -> str:
+        time.sleep(0.1)
+        return super().make_part_c()
+
+
+class ProductTemplate:
+    """
+    A prebuilt product that is stamped out by cloning. Products that define
+    clone() use it; others are deep-copied. Products that set clone to None
+    cannot be stamped out and are rejected.
+    """
+
+    def __init__(self, prototype: Any) -> None:
+        self._prototype = prototype
+        if not hasattr(prototype, "clone"):
+            self._clone = lambda: copy.deepcopy(prototype)
+        elif prototype.clone is None:
+            raise TypeError(f"{type(prototype).__name__} cannot be cloned, build each copy with the builder")
+        else:
+            self._clone = prototype.clone
+
+    def stamp(self) -> Any:
+        return self._clone()
+
+    def stamp_many(self, count: int) -> List[Any]:
+        clone = self._clone
+        return [clone() for _ in range(count)]
+
+
+def benchmark_recipe(count: int = 1_000_000) -> None:
+    """
+    Build `count` full featured products step by step, then stamp the same
+    number out of a compiled recipe.
+    """
+    director = Director()
+    builder = ConcreteBuilder1()
+    director.builder = builder
+
+    start = time.perf_counter()
+    products = []
+    for _ in range(count):
+        director.build_full_featured_product()
+        products.append(builder.product)
+    print(f"step by step: {time.perf_counter() - start:.2f}s")
+    del products
+
+    start = time.perf_counter()
+    template = director.compile(director.record(director.build_full_featured_product))
+    products = template.stamp_many(count)
+    print(f"compiled recipe: {time.perf_counter() - start:.2f}s")
+
 
 if __name__ == "__main__":
     """
@@ -165,3 +454,37 @@ if __name__ == "__main__":
     builder.produce_part_a()
     builder.produce_part_b()
     builder.product.list_parts()
+
+    print("\n")
+
+    # A streaming builder writes every part out as soon as it is produced.
+    print("Streamed full featured product: ")
+    director.builder = StreamingBuilder(sys.stdout, flush_each_part=True)
+    director.build_full_featured_product()
+    director.builder.product.list_parts()
+
+    print("\n")
+
+    # Record the full featured build once, then stamp out copies of it.
+    print("Stamped full featured products: ")
+    director.builder = builder
+    template = director.compile(director.record(director.build_full_featured_product))
+    for product in template.stamp_many(2):
+        product.list_parts()
+        print()
+
+    print("\n")
+
+    # Independent slow steps run concurrently under the ParallelDirector.
+    with ParallelDirector() as parallel_director:
+        for director in (Director(), parallel_director):
+            director.builder = SlowBuilder()
+            start = time.perf_counter()
+            director.build_full_featured_product()
+            print(f"{type(director).__name__}: ", end="")
+            director.builder.product.list_parts()
+            print(f" in {time.perf_counter() - start:.2f}s")
+
+    print("\n")
+
+    benchmark_recipe()
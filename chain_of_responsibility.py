@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 class Handler(ABC):
     """
@@ -30,6 +30,11 @@ class AbstractHandler(Handler):
 
     _next_handler: Handler = None # initially None
 
+    # Set to True when the handler never matches a request that another
+    # handler in the chain could match, so its position does not change the
+    # result. The ChainExecutor may then move it to reduce the average walk.
+    order_independent: bool = False
+
     def set_next(self, handler: Handler) -> Handler:
         self._next_handler = handler
         # Returning a handler from here will let us link handlers in a
@@ -45,6 +50,44 @@ class AbstractHandler(Handler):
         return None
 
 
+class PredicateHandler(AbstractHandler):
+    """
+    A handler that splits its decision from its answer: it handles exactly
+    the requests for which matches() is true, with respond(). This lets a
+    ChainExecutor ask each handler on its own, without walking the chain.
+    """
+
+    def handle(self, request: Any) -> str:
+        if self.matches(request):
+            return self.respond(request)
+        else:
+            return super().handle(request)
+
+    @abstractmethod
+    def matches(self, request: Any) -> bool:
+        pass
+
+    @abstractmethod
+    def respond(self, request: Any) -> str:
+        pass
+
+
+class KeyedHandler(PredicateHandler):
+    """
+    A handler that matches requests by exact equality against the keys it
+    declares in `accepts`. Because the keys are known up front, a chain of
+    such handlers can be compiled into a hash table (see CompiledChain).
+    """
+
+    accepts: FrozenSet[Any] = frozenset()
+
+    def matches(self, request: Any) -> bool:
+        try:
+            return request in self.accepts
+        except TypeError:  # Unhashable requests never match a key
+            return False
+
+
 """
 All Concrete Handlers either handle a request or pass it to the next handler in
 the chain.
@@ -52,28 +95,124 @@ the chain.
 
 # if condition satisfy then handle the condition  else return super().handle(request)
 
-class MonkeyHandler(AbstractHandler):
-    def handle(self, request: Any) -> str:
-        if request == "Banana":
-            return f"Monkey: I'll eat the {request}"
-        else:
-            return super().handle(request)
+class MonkeyHandler(KeyedHandler):
+    order_independent = True
+    accepts = frozenset({"Banana"})
 
+    def respond(self, request: Any) -> str:
+        return f"Monkey: I'll eat the {request}"
 
-class SquirrelHandler(AbstractHandler):
-    def handle(self, request: Any) -> str:
-        if request == "Nut":
-            return f"Squirrel: I'll eat the {request}"
-        else:
-            return super().handle(request)
 
+class SquirrelHandler(KeyedHandler):
+    order_independent = True
+    accepts = frozenset({"Nut"})
 
-class DogHandler(AbstractHandler):
-    def handle(self, request: Any) -> str:
-        if request == "MeatBall":
-            return f"Dog: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    def respond(self, request: Any) -> str:
+        return f"Squirrel: I'll eat the {request}"
+
+
+class DogHandler(KeyedHandler):
+    order_independent = True
+    accepts = frozenset({"MeatBall"})
+
+    def respond(self, request: Any) -> str:
+        return f"Dog: I'll eat the {request}"
+
+
+class CompiledChain:
+    """
+    A chain compiled for fast dispatch. Requests accepted by KeyedHandlers are
+    looked up in a hash table that maps each key to the first handler in the
+    chain accepting it. Any other handler may match arbitrary requests, so
+    when one sits before the table's answer (or there is no answer) the chain
+    is walked linearly from the first such handler, exactly like the original
+    chain would. Results are the same as `head.handle(request)`.
+
+    The chain is compiled once: later set_next() calls are not picked up.
+    """
+
+    def __init__(self, head: Handler) -> None:
+        self._head = head
+        self._table: Dict[Any, Tuple[int, KeyedHandler]] = {}
+        self._first_predicate: Optional[Tuple[int, Handler]] = None
+
+        handler, position = head, 0
+        while handler is not None:
+            if isinstance(handler, KeyedHandler):
+                for key in handler.accepts:
+                    self._table.setdefault(key, (position, handler))
+            elif self._first_predicate is None:
+                self._first_predicate = (position, handler)
+            handler = getattr(handler, "_next_handler", None)
+            position += 1
+
+    def handle(self, request: Any) -> Optional[str]:
+        try:
+            match = self._table.get(request)
+        except TypeError:  # Unhashable: only the linear walk can decide
+            return self._head.handle(request)
+        if self._first_predicate is not None:
+            position, handler = self._first_predicate
+            if match is None or position < match[0]:
+                return handler.handle(request)
+        if match is None:
+            return None
+        return match[1].respond(request)
+
+
+class ChainExecutor:
+    """
+    Runs a chain of PredicateHandlers iteratively instead of through nested
+    handle() calls, so chains of any length work without hitting the
+    recursion limit. It counts how often each handler answers, and every
+    `reorder_every` requests (never if 0) moves the most-hit order-independent
+    handlers towards the front. Handlers that are not order-independent keep
+    their relative order, so results are the same as `head.handle(request)`.
+
+    The chain is read once: later set_next() calls are not picked up.
+    """
+
+    def __init__(self, head: Handler, reorder_every: int = 1000) -> None:
+        if reorder_every < 0:
+            raise ValueError("reorder_every must not be negative")
+        self.handlers: List[PredicateHandler] = []
+        handler = head
+        while handler is not None:
+            if not isinstance(handler, PredicateHandler):
+                raise TypeError(f"{type(handler).__name__} does not define matches() and respond()")
+            self.handlers.append(handler)
+            handler = handler._next_handler
+        self.hits: List[int] = [0] * len(self.handlers)
+        self.reorder_every = reorder_every
+        self._requests = 0
+
+    def handle(self, request: Any) -> Optional[str]:
+        self._requests += 1
+        if self.reorder_every and self._requests % self.reorder_every == 0:
+            self.reorder()
+        for position, handler in enumerate(self.handlers):
+            if handler.matches(request):
+                self.hits[position] += 1
+                return handler.respond(request)
+        return None
+
+    def reorder(self) -> None:
+        """
+        Merge the order-independent handlers, most hit first, into the fixed
+        sequence of the other handlers, always taking whichever of the two
+        candidates has more hits. Hit counts are then halved so the order
+        keeps adapting to recent traffic.
+        """
+        ranked = list(zip(self.hits, self.handlers))
+        fixed = [entry for entry in ranked if not getattr(entry[1], "order_independent", False)]
+        movable = sorted((entry for entry in ranked if getattr(entry[1], "order_independent", False)),
+                         key=lambda entry: entry[0], reverse=True)
+        merged = []
+        while fixed and movable:
+            merged.append(movable.pop(0) if movable[0][0] > fixed[0][0] else fixed.pop(0))
+        merged += fixed + movable
+        self.hits = [hits // 2 for hits, _ in merged]
+        self.handlers = [handler for _, handler in merged]
 
 
 def client_code(handler: Handler) -> None:
@@ -106,6 +245,18 @@ if __name__ == "__main__":
 
     print("Subchain: Squirrel > Dog")
     client_code(squirrel)
+    print("\n")
+
+    # A compiled chain gives the same answers with one hash lookup.
+    print("Compiled chain: Monkey > Squirrel > Dog")
+    client_code(CompiledChain(monkey))
+    print("\n")
+
+    # The iterative executor has no depth limit and learns which handlers are busy.
+    print("Executed chain: Monkey > Squirrel > Dog")
+    executor = ChainExecutor(monkey, reorder_every=2)
+    client_code(executor)
+    print(f"\nHandler order: {[type(handler).__name__ for handler in executor.handlers]}")
 
 # OUTPUT
 
@@ -125,4 +276,23 @@ if __name__ == "__main__":
 # Client: Who wants a Banana?
 #   Banana was left untouched.
 # Client: Who wants a Cup of coffee?
-#   Cup of coffee was left untouched.
\ No newline at end of file
+#   Cup of coffee was left untouched.
+
+# Compiled chain: Monkey > Squirrel > Dog
+
+# Client: Who wants a Nut?
+#   Squirrel: I'll eat the Nut
+# Client: Who wants a Banana?
+#   Monkey: I'll eat the Banana
+# Client: Who wants a Cup of coffee?
+#   Cup of coffee was left untouched.
+
+# Executed chain: Monkey > Squirrel > Dog
+
+# Client: Who wants a Nut?
+#   Squirrel: I'll eat the Nut
+# Client: Who wants a Banana?
+#   Monkey: I'll eat the Banana
+# Client: Who wants a Cup of coffee?
+#   Cup of coffee was left untouched.
+# Handler order: ['SquirrelHandler', 'MonkeyHandler', 'DogHandler']
\ No newline at end of file